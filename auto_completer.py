@@ -4,18 +4,37 @@
 AutoCompleter handles autocompletion based on the list of domain names.
 """
 
+from bisect import bisect_left, bisect_right
+
+
 class AutoCompleter(object):
-    
+
     def __init__(self, options):
         self.options = sorted(options)
-    
+        self.text = None
+        self.matches = []
+
+    def prefix_matches(self, text):
+        """
+        Returns the options starting with the text in sorted order. Since the
+        options are sorted the matches form a contiguous range which is found
+        by binary search. The matches for the last text are cached.
+
+        :param text: the text to be completed
+        :type text: str
+        :return: the matching options
+        :rtype: [str]
+        """
+        if text != self.text:
+            start = bisect_left(self.options, text)
+            end = bisect_right(self.options, text + "\U0010ffff", start)
+            self.text = text
+            self.matches = self.options[start:end]
+        return self.matches
+
     def complete(self, text, state):
         if state == 0:
-            if text:
-                self.matches = [option for option in self.options if option and
-                    option.startswith(text)]
-            else:
-                self.matches = self.options[:]
+            self.prefix_matches(text)
         try:
             return self.matches[state]
         except IndexError:
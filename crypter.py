@@ -7,8 +7,17 @@ PKCS7 padding and the creation of keys, initialization vectors, and salts.
 
 from Crypto.Cipher import AES
 from hashlib import pbkdf2_hmac
+import hmac
 import os
 
+try:
+    from Crypto.Util._cpu_features import have_aes_ni
+    AES_NI_AVAILABLE = bool(have_aes_ni())
+except ImportError:
+    AES_NI_AVAILABLE = False
+
+PKCS7_PADDINGS = [bytes([length]) * length for length in range(1, 17)]
+
 
 class Crypter(object):
     def __init__(self, key_initialization_vector):
@@ -19,6 +28,17 @@ class Crypter(object):
             raise ValueError("Wrong length of the key and the initialization "
                 + "vector.")
 
+    def create_cipher(self):
+        """
+        Creates an AES cipher in CBC mode for the key and the initialization
+        vector. A CBC cipher object carries the chaining state of a single
+        encryption or decryption, so a new one is needed for every call.
+
+        :return: the cipher
+        :rtype: Crypto.Cipher._mode_cbc.CbcMode
+        """
+        return AES.new(self.key, AES.MODE_CBC, self.initialization_vector)
+
     @staticmethod
     def create_key(password, salt, iterations = 1024):
         """
@@ -83,9 +103,7 @@ class Crypter(object):
         :return: the data with padding
         :rtype: bytes
         """
-        length = 16 - (len(data) % 16)
-        data += bytes([length]) * length
-        return data
+        return data + PKCS7_PADDINGS[15 - (len(data) % 16)]
 
     def encrypt(self, data):
         """
@@ -96,8 +114,7 @@ class Crypter(object):
         :return: the encrypted data
         :rtype: bytes
         """
-        aes_object = AES.new(self.key, AES.MODE_CBC, self.initialization_vector)
-        return aes_object.encrypt(self.add_pkcs7_padding(data))
+        return self.create_cipher().encrypt(self.add_pkcs7_padding(data))
 
     def encrypt_unpadded(self, data):
         """
@@ -109,20 +126,27 @@ class Crypter(object):
         :return: the encrypted data
         :rtype: bytes
         """
-        aes_object = AES.new(self.key, AES.MODE_CBC, self.initialization_vector)
-        return aes_object.encrypt(data)
+        return self.create_cipher().encrypt(data)
 
     @staticmethod
     def remove_pkcs7_padding(data):
         """
-        Removes the PKCS7 padding.
+        Removes the PKCS7 padding. The padding bytes are compared in constant
+        time so the check does not reveal where the padding is wrong.
 
         :param data: the data with padding
         :type data: bytes
         :return: the data without padding
         :rtype: bytes
         """
-        return data[:-data[-1]]
+        if len(data) == 0 or len(data) % 16 != 0:
+            raise ValueError("The padded data must be a non-empty multiple of "
+                + "16 bytes long.")
+        length = data[-1]
+        if not 1 <= length <= 16 or not hmac.compare_digest(data[-length:],
+            PKCS7_PADDINGS[length - 1]):
+            raise ValueError("The PKCS7 padding is invalid.")
+        return data[:-length]
 
     def decrypt(self, encrypted_data):
         """
@@ -133,8 +157,8 @@ class Crypter(object):
         :return: the decrypted data
         :rtype: bytes
         """
-        aes_object = AES.new(self.key, AES.MODE_CBC, self.initialization_vector)
-        return self.remove_pkcs7_padding(aes_object.decrypt(encrypted_data))
+        return self.remove_pkcs7_padding(
+            self.create_cipher().decrypt(encrypted_data))
 
     def decrypt_unpadded(self, encrypted_data):
         """
@@ -146,5 +170,4 @@ class Crypter(object):
         :return: the decrypted data
         :rtype: bytes
         """
-        aes_object = AES.new(self.key, AES.MODE_CBC, self.initialization_vector)
-        return aes_object.decrypt(encrypted_data)
+        return self.create_cipher().decrypt(encrypted_data)
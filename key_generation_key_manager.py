@@ -42,7 +42,7 @@ class KeyGenerationKeyManager(object):
         :param preference_manager: the preference manager
         :type preference_manager: PreferenceManager
         """
-        if type(preference_manager) != PreferenceManager:
+        if not isinstance(preference_manager, PreferenceManager):
             raise TypeError
         self.preference_manager = preference_manager
 
@@ -66,7 +66,7 @@ class KeyGenerationKeyManager(object):
         :param salt: the salt
         :type salt: bytes
         """
-        if type(salt) == bytes:
+        if isinstance(salt, bytes):
             self.salt = salt
             if self.preference_manager:
                 self.preference_manager.store_salt(salt)
@@ -93,14 +93,17 @@ class KeyGenerationKeyManager(object):
 
     def create_new_key_generation_key(self):
         """
-        Creates a new key generation key. This overwrites the previous one.
+        Creates a new key generation key together with a new initialization
+        vector 2 and a new salt 2 from a single call to the random number
+        generator. This overwrites the previous ones.
 
         :return: a new key generation key
         :rtype: bytes
         """
-        self.key_generation_key = os.urandom(64)
-        self.initialization_vector2 = Crypter.create_initialization_vector()
-        self.salt2 = Crypter.create_salt()
+        random_bytes = os.urandom(112)
+        self.key_generation_key = random_bytes[:64]
+        self.initialization_vector2 = random_bytes[64:80]
+        self.salt2 = random_bytes[80:]
         return self.key_generation_key
 
     def decrypt_key_generation_key(self, encrypted_key_generation_key,
@@ -195,8 +198,8 @@ class KeyGenerationKeyManager(object):
         :return: key generation key block
         :rtype: bytes
         """
-        return self.key_generation_key_crypter.encrypt_unpadded(self.salt2 +
-            self.initialization_vector2 + self.key_generation_key)
+        return self.key_generation_key_crypter.encrypt_unpadded(b"".join([
+            self.salt2, self.initialization_vector2, self.key_generation_key]))
 
     def get_new_encrypted_key_generation_key_block(self):
         """
@@ -231,17 +234,19 @@ class KeyGenerationKeyManager(object):
             key_generation_key_block)
         return key_generation_key_block
 
-    def store_key_generation_key_block_salt(self):
+    def store_key_generation_key_block_salt(self, settings_data):
         """
-        Stores the key generation key block.
+        Stores the salt, the key generation key block, and the encrypted
+        settings data in a single write.
+
+        :param settings_data: encrypted settings data
+        :type settings_data: bytes
         """
-        if self.preference_manager:
-            self.preference_manager.store_key_generation_key_block(
-                self.get_encrypted_key_generation_key_block())
-        if len(self.salt) == 32:
-            self.store_salt(self.salt)
-        else:
+        if len(self.salt) != 32:
             raise ValueError("The salt must be 32 bytes long.")
+        if self.preference_manager:
+            self.preference_manager.store_all(self.salt,
+                self.get_encrypted_key_generation_key_block(), settings_data)
 
     def reset(self):
         """
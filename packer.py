@@ -25,24 +25,13 @@ class Packer(object):
         :return: the compressed data
         :rtype: bytes
         """
-        compress_object = zlib.compressobj(
-            zlib.Z_BEST_COMPRESSION,
-            zlib.DEFLATED,
-            zlib.MAX_WBITS,
-            zlib.DEF_MEM_LEVEL,
-            zlib.Z_DEFAULT_STRATEGY)
-        if type(data) == str:
-            compressed_data = compress_object.compress(data.encode("utf-8"))
-            compressed_data += compress_object.flush()
-            return struct.pack("!I", len(data.encode("utf-8"))) + \
-                compressed_data
-        elif type(data) == bytes:
-            compressed_data = compress_object.compress(data)
-            compressed_data += compress_object.flush()
-            return struct.pack("!I", len(data)) + compressed_data
-        else:
-            raise TypeError("Please pass a string or bytes as the uncompressed"
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        elif not isinstance(data, bytes):
+            raise TypeError("Please pass a string or bytes as the uncompressed "
                 + "data.")
+        return struct.pack("!I", len(data)) + \
+            zlib.compress(data, zlib.Z_BEST_COMPRESSION)
 
     @staticmethod
     def decompress(compressed_data):
@@ -55,7 +44,7 @@ class Packer(object):
         :return: the uncompressed data
         :rtype: bytes
         """
-        if type(compressed_data) == bytes:
+        if isinstance(compressed_data, bytes):
             try:
                 return zlib.decompress(compressed_data[4:])
             except zlib.error:
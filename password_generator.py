@@ -10,7 +10,7 @@ from hashlib import pbkdf2_hmac
 
 class PasswordGenerator(object):
     """
-    Salt defaults to a randomly generated salt, iteration count to 4096.
+    Salt defaults to a new randomly generated salt, iteration count to 4096.
 
     :param domain: the domain
     :type domain: str
@@ -22,12 +22,10 @@ class PasswordGenerator(object):
     :type iterations: int
     """
     def __init__(self, domain, key_generation_key,
-        salt = Crypter.create_salt(), iterations = 4096):
-        start_value = b""
-        for value in domain.encode("utf-8"):
-            start_value += bytes([value])
-        for value in key_generation_key:
-            start_value += bytes([value])
+        salt = None, iterations = 4096):
+        if salt is None:
+            salt = Crypter.create_salt()
+        start_value = domain.encode("utf-8") + bytes(key_generation_key)
         if iterations < 1:
             print("Desired number of iterations was below 1." +
                 "Using 4096 iterations instead.")
@@ -44,26 +42,18 @@ class PasswordGenerator(object):
         :rtype: str
         """
         number = int.from_bytes(self.hash_value, byteorder = "big")
-        password = ""
         character_set = setting.get_character_set()
-        digits_set = setting.get_digits_character_set()
-        lower_set = setting.get_lower_case_character_set()
-        upper_set = setting.get_upper_case_character_set()
-        extra_set = setting.get_extra_character_set()
-        template = setting.get_template()
-        for value in template:
-            if number > 0:
-                if value == "a":
-                    current_set = lower_set
-                elif value == "A":
-                    current_set = upper_set
-                elif value == "n":
-                    current_set = digits_set
-                elif value == "o":
-                    current_set = extra_set
-                else:
-                    current_set = character_set
-                if len(current_set) > 0:
-                    password = password + current_set[number % len(current_set)]
-                    number //= len(current_set)
-        return password
+        character_sets = {
+            "a": setting.get_lower_case_character_set(),
+            "A": setting.get_upper_case_character_set(),
+            "n": setting.get_digits_character_set(),
+            "o": setting.get_extra_character_set()}
+        password = []
+        for value in setting.get_template():
+            if number <= 0:
+                break
+            current_set = character_sets.get(value, character_set)
+            if len(current_set) > 0:
+                number, index = divmod(number, len(current_set))
+                password.append(current_set[index])
+        return "".join(password)
@@ -8,8 +8,11 @@ from password_generator import PasswordGenerator
 from preference_manager import PreferenceManager
 from key_generation_key_manager import KeyGenerationKeyManager
 from settings_manager import SettingsManager
+from setting import Setting
 from auto_completer import AutoCompleter
+from crypter import AES_NI_AVAILABLE
 from datetime import datetime
+from itertools import groupby
 import argparse
 import getpass
 import readline
@@ -17,40 +20,44 @@ import sys
 import pyperclip
 from termcolor import colored
 
-def create_settings_manager(key_generation_key_manager):
+OPTIONS_1_TO_6 = frozenset("123456")
+
+def create_settings_manager(key_generation_key_manager, master_password):
     """
     Creates the settings manager.
     :param key_generation_key_manager: the key generation key manager
     :type key_generation_key_manager: KeyGenerationKeyManager
+    :param master_password: the UTF-8 encoded master password
+    :type master_password: bytearray
     """
     preference_manager = PreferenceManager()
     key_generation_key_manager.set_preference_manager(preference_manager)
     key_generation_key_manager.decrypt_key_generation_key(
         preference_manager.get_key_generation_key_block(),
-        password = master_password.encode("utf-8"),
+        password = master_password,
         salt = preference_manager.get_salt())
     return SettingsManager(preference_manager), preference_manager
 
-def has_setting(domain):
+def has_setting(domain, completer):
     """
     Returns the domain name and True if settings for the domain are stored.
+    If there are no settings for the domain name itself the user may choose a
+    domain name starting with it.
     
     :param domain: the domain name
     :type domain: str
+    :param completer: the auto completer for the stored domain names
+    :type completer: AutoCompleter
     """
-    setting_found = False
-    if domain in settings_manager.get_domain_list():
-        setting_found = True
-    else:
-        for dom in settings_manager.get_domain_list():
-            if dom[:len(domain)] == domain:
-                print('For "' + dom + '" settings were found.')
-                answer = input("Load settings? [y/n] ")
-                if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                    "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
-                    domain = dom
-                    setting_found = True
-    return domain, setting_found
+    matches = completer.prefix_matches(domain)
+    if matches and matches[0] == domain:
+        return domain, True
+    for dom in matches:
+        print('For "' + dom + '" settings were found.')
+        answer = input("Load settings? [y/n] ")
+        if not Setting.is_negative_answer(answer):
+            return dom, True
+    return domain, False
 
 def get_username(setting, option):
     """
@@ -109,26 +116,36 @@ def get_generated_password(setting, key_generation_key, option):
         colored_password = color_password(password)
         print("Generated password: " + colored_password)
 
+def get_character_color(character):
+    """
+    Returns the color of a password character: blue for digits, green for
+    lower-case letters, red for upper-case letters, and yellow for special
+    characters.
+
+    :param character: the password character
+    :type character: string
+    """
+    if character.isdigit():
+        return 'blue'
+    elif character.islower():
+        return 'green'
+    elif character.isupper():
+        return 'red'
+    else:
+        return 'yellow'
+
 def color_password(password):
     """
     Colors the password before displaying. Digits are printed in blue,
     lower-case letters in green, upper-case letters in red,
-    and special characters in yellow.
+    and special characters in yellow. Consecutive characters of the same
+    color are colored together.
         
     :param password: the password to be colored
     :type setting: string
-    """    
-    colored_password = ''
-    for char in password:
-        if char.isdigit():
-            colored_password += colored(char, 'blue')
-        elif char.islower():
-            colored_password += colored(char, 'green')
-        elif char.isupper():
-            colored_password += colored(char, 'red') 
-        else:
-            colored_password += colored(char, 'yellow')
-    return  colored_password
+    """
+    return "".join(colored("".join(characters), color) for color, characters
+        in groupby(password, key = get_character_color))
         
 def get_password(setting, key_generation_key, option):
     """
@@ -169,25 +186,25 @@ def setting_menu(setting, key_generation_key_manager, settings_manager):
             + "\n2\tdisplay username and password"
             + "\n3\tdisplay settings except for password\n4\tchange settings"
             + "\n5\tdelete domain\n6\treturn to previous menu\n[1/2/3/4/5/6] ")
-        while option not in ["1", "2", "3", "4", "5", "6"]:
+        while option not in OPTIONS_1_TO_6:
             option = input('Enter "1", "2", "3", "4", "5", or "6": ')
-        if option in ["1", "2"]:
+        if option in ("1", "2"):
             get_password(setting,
                 key_generation_key_manager.get_key_generation_key(), option)
         elif option == "3":
             setting.get_settings()
         elif option == "4":
+            previous_domain = setting.get_domain()
             if setting.has_fixed_password():
                 setting.set_settings_menu_fixed_password()
             else:
                 setting.set_settings_menu_generated_password()
-            settings_manager.set_setting(setting)
+            settings_manager.set_setting(setting, previous_domain)
             setting.set_modification_date(datetime.now())
             settings_manager.store_settings(key_generation_key_manager)
         elif option == "5":
             answer = input("Are you sure you want to delete the domain? [y/n] ")
-            if answer not in ["n", "N", "no", "No", "NO", "not", "Not", "NOT",
-                "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+            if not Setting.is_negative_answer(answer):
                 settings_manager.delete_setting(setting)
                 settings_manager.store_settings(key_generation_key_manager)
                 input("The domain was deleted. Press any key to continue.")
@@ -202,10 +219,15 @@ if __name__ == "__main__":
         help = "Only prompts for master password and domain name and copies " +
         "username and password to the clipboard.")
     args = parser.parse_args()
-    master_password = getpass.getpass(prompt = "Master password: ")
+    if not AES_NI_AVAILABLE and not args.quiet:
+        print("Warning: AES-NI is not available. The settings are encrypted " +
+            "and decrypted without hardware acceleration.")
+    master_password = bytearray(getpass.getpass(prompt = "Master password: "),
+        "utf-8")
     key_generation_key_manager = KeyGenerationKeyManager()
     settings_manager, preference_manager = \
-        create_settings_manager(key_generation_key_manager)
+        create_settings_manager(key_generation_key_manager, master_password)
+    master_password[:] = bytes(len(master_password))
     key_generation_key_exists = len(
         preference_manager.get_key_generation_key_block()) == 112
     try:
@@ -213,18 +235,19 @@ if __name__ == "__main__":
     except PermissionError:
         print("Wrong master password.")
         sys.exit(1)
+    readline.set_completer_delims(readline.get_completer_delims().translate(
+        str.maketrans("", "", " @-")))
+    readline.parse_and_bind('tab: complete')
+    completer_version = None
     while True:
-        completer = AutoCompleter(settings_manager.get_domain_list())
-        completer_delimiters = readline.get_completer_delims()
-        completer_delimiters = completer_delimiters.translate(
-         {ord(character): None for character in " @-"})
-        readline.set_completer_delims(completer_delimiters)
-        readline.set_completer(completer.complete)
-        readline.parse_and_bind('tab: complete')
+        if completer_version != settings_manager.get_version():
+            completer = AutoCompleter(settings_manager.get_domain_list())
+            completer_version = settings_manager.get_version()
+            readline.set_completer(completer.complete)
         domain = input("Enter a domain name or press Enter to quit: ")
         if domain == "":
             sys.exit(1)
-        domain, setting_found = has_setting(domain)
+        domain, setting_found = has_setting(domain, completer)
         if args.quiet:
             if setting_found:
                 setting = settings_manager.get_setting(domain)
@@ -240,8 +263,7 @@ if __name__ == "__main__":
             else:
                 print('For "' + domain + '" no settings were found.')
                 answer = input("Create a new domain? [y/n] ")
-                if answer in ["n", "N", "no", "No", "NO", "not", "Not", "NOT",
-                    "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+                if Setting.is_negative_answer(answer):
                     input("No domain was created. Press any key to continue.")
                 else:
                     setting = settings_manager.get_setting(domain)
@@ -15,17 +15,46 @@ class PreferenceManager(object):
             Defaults to ~/.passwords.
         :type settings_file: str
         """
-        self.data = b""
+        self.data = bytearray()
         self.settings_file = settings_file
         self.read_file()
 
     def read_file(self):
         """
-        Reads the settings file.
+        Reads the settings file. The data are kept in a bytearray so storing
+        a part of them replaces it in place.
         """
         if os.path.isfile(self.settings_file):
             with open(self.settings_file, "rb") as file:
-                self.data = file.read()
+                self.data = bytearray(file.read())
+
+    @staticmethod
+    def _check_salt(salt):
+        """
+        Raises an error if the salt is not 32 bytes.
+
+        :param salt: the salt
+        :type salt: bytes
+        """
+        if not isinstance(salt, bytes):
+            raise TypeError("The salt must be of type byte.")
+        if len(salt) != 32:
+            raise ValueError("The salt must be 32 bytes long.")
+
+    @staticmethod
+    def _check_key_generation_key_block(key_generation_key_block):
+        """
+        Raises an error if the key generation key block is not 112 bytes.
+
+        :param key_generation_key_block: the encrypted key generation key block
+        :type key_generation_key_block: bytes
+        """
+        if not isinstance(key_generation_key_block, bytes):
+            raise TypeError("The key generation key block must be of type " +
+                "byte.")
+        if len(key_generation_key_block) != 112:
+            raise ValueError("The key generation key block must be 112 bytes "
+                + "long.")
 
     def get_salt(self):
         """
@@ -34,7 +63,7 @@ class PreferenceManager(object):
         :return: the salt
         :rtype: bytes
         """
-        return self.data[:32]
+        return bytes(memoryview(self.data)[:32])
 
     def store_salt(self, salt):
         """
@@ -43,10 +72,7 @@ class PreferenceManager(object):
         :param salt: the salt
         :type salt: bytes
         """
-        if type(salt) != bytes:
-            raise TypeError("The salt must be of type byte.")
-        if len(salt) != 32:
-            raise ValueError("The salt must be 32 bytes long.")
+        PreferenceManager._check_salt(salt)
         if os.path.isfile(self.settings_file):
             with open(self.settings_file, "rb+") as file:
                 file.seek(0)
@@ -54,7 +80,7 @@ class PreferenceManager(object):
         else:
             with open(self.settings_file, "wb") as file:
                 file.write(salt)
-        self.data = salt + self.data[32:]
+        self.data[:32] = salt
 
     def get_key_generation_key_block(self):
         """
@@ -63,7 +89,7 @@ class PreferenceManager(object):
         :return: key generation key block
         :rtype: bytes
         """
-        return self.data[32:144]
+        return bytes(memoryview(self.data)[32:144])
 
     def store_key_generation_key_block(self, key_generation_key_block):
         """
@@ -73,12 +99,8 @@ class PreferenceManager(object):
         :param key_generation_key_block: the encrypted key generation key block
         :type key_generation_key_block: bytes
         """
-        if type(key_generation_key_block) != bytes:
-            raise TypeError("The key generation key block must be of type " +
-                "byte.")
-        if len(key_generation_key_block) != 112:
-            raise ValueError("The key generation key block must be 112 bytes "
-                + "long.")
+        PreferenceManager._check_key_generation_key_block(
+            key_generation_key_block)
         if os.path.isfile(self.settings_file):
             with open(self.settings_file, "rb+") as file:
                 file.seek(32)
@@ -87,7 +109,7 @@ class PreferenceManager(object):
             with open(self.settings_file, "wb") as file:
                 file.write(b"\x00" * 32)
                 file.write(key_generation_key_block)
-        self.data = self.data[:32] + key_generation_key_block + self.data[144:]
+        self.data[32:144] = key_generation_key_block
 
     def get_settings_data(self):
         """
@@ -96,25 +118,33 @@ class PreferenceManager(object):
         :return: encrypted settings data
         :rtype: bytes
         """
-        return self.data[144:]
+        return bytes(memoryview(self.data)[144:])
 
-    def store_settings_data(self, settings_data):
+    def store_all(self, salt, key_generation_key_block, settings_data):
         """
-        Writes the encrypted settings data to the bytes beginning with byte 144
-        of the settings file.
+        Writes the salt, the key generation key block, and the encrypted
+        settings data to the settings file with a single write and syncs it to
+        the disk.
 
+        :param salt: the salt
+        :type salt: bytes
+        :param key_generation_key_block: the encrypted key generation key block
+        :type key_generation_key_block: bytes
         :param settings_data: encrypted settings data
         :type settings_data: bytes
         """
-        if type(settings_data) != bytes:
+        PreferenceManager._check_salt(salt)
+        PreferenceManager._check_key_generation_key_block(
+            key_generation_key_block)
+        if not isinstance(settings_data, bytes):
             raise TypeError("The settings data must be of type byte.")
+        self.data = bytearray(salt + key_generation_key_block + settings_data)
         if os.path.isfile(self.settings_file):
-            with open(self.settings_file, "rb+") as file:
-                file.seek(144)
-                file.write(settings_data)
-                file.truncate()
+            mode = "rb+"
         else:
-            with open(self.settings_file, "wb") as file:
-                file.write(b"\x00" * 144)
-                file.write(settings_data)
-        self.data = self.data[:144] + settings_data
+            mode = "wb"
+        with open(self.settings_file, mode) as file:
+            file.write(self.data)
+            file.truncate()
+            file.flush()
+            os.fsync(file.fileno())
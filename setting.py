@@ -9,7 +9,6 @@ from datetime import datetime
 import getpass
 import string
 import re
-import binascii
 from base64 import b64encode, b64decode
 from random import shuffle
 
@@ -17,6 +16,41 @@ DEFAULT_LOWER_CASE_CHARACTERS = string.ascii_lowercase
 DEFAULT_UPPER_CASE_CHARACTERS = string.ascii_uppercase
 DEFAULT_DIGITS = string.digits
 DEFAULT_EXTRA_CHARACTERS = '#!"§$%&/()[]{}=-_+*<>;:.'
+DEFAULT_CHARACTER_SET = DEFAULT_DIGITS + DEFAULT_LOWER_CASE_CHARACTERS + \
+    DEFAULT_UPPER_CASE_CHARACTERS + DEFAULT_EXTRA_CHARACTERS
+NEGATIVE_ANSWERS = frozenset(["n", "no", "not", "nay", "nein"])
+OPTIONS_1_TO_7 = frozenset("1234567")
+OPTIONS_1_TO_8 = frozenset("12345678")
+# Bits: 1 digits, 2 lower case characters, 4 upper case characters, 8 extra
+# characters
+COMPLEXITY_BY_MARKERS = {1: 1, 2: 2, 4: 3, 3: 4, 5: 5, 7: 6, 15: 7, 8: 8}
+# Arguments of calculate_template (use_lower_case, use_upper_case, use_digits,
+# use_extra) for each complexity
+COMPLEXITY_FLAGS = {
+    1: (False, False, True, False),
+    2: (True, False, False, False),
+    3: (False, True, False, False),
+    4: (True, False, True, False),
+    5: (False, True, True, False),
+    6: (True, True, True, False),
+    7: (True, True, True, True),
+    8: (False, False, False, True)}
+COMPLEXITY_DESCRIPTIONS = {
+    1: "digits",
+    2: "lower case characters",
+    3: "upper case characters",
+    4: "digits and lower case characters",
+    5: "digits and upper case characters",
+    6: "digits, lower case characters, and upper case characters",
+    7: "digits, lower case characters, upper case characters, and extra "
+        "characters",
+    8: "extra characters"}
+COMPLEXITY_OPTIONS = "".join(str(complexity) + "\t" + description + "\n"
+    for complexity, description in COMPLEXITY_DESCRIPTIONS.items()) + \
+    "[1/2/3/4/5/6/7/8] "
+COMPLEXITY_PROMPT = "Choose a password complexity:\n" + COMPLEXITY_OPTIONS
+COMPLEXITY_NEW_PROMPT = "Choose a new password complexity:\n" + \
+    COMPLEXITY_OPTIONS
 
 
 class Setting(object):
@@ -29,6 +63,7 @@ class Setting(object):
         self.length = 16
         self.iterations = 4096
         self.salt = Crypter.create_salt()
+        self.salt_base64 = None
         self.creation_date = datetime.now()
         self.modification_date = self.creation_date
         self.extra_characters = DEFAULT_EXTRA_CHARACTERS
@@ -36,24 +71,38 @@ class Setting(object):
         self.calculate_template(True, True, True, True)
 
     def __str__(self):
-        output = "<" + self.domain + ": ("
+        output = ["<" + self.domain + ": ("]
         if self.username:
-            output += "username: " + str(self.username) + ", "
+            output.append("username: " + str(self.username) + ", ")
         if self.fixed_password:
-            output += "fixed password: " + str(self.fixed_password) + ", "
-        output += "password length: " + str(self.length) + ", "
-        output += "extra character set: \"" + self.extra_characters + "\", "
-        output += "iteration count: " + str(self.iterations) + ", "
-        output += "salt: " + str(binascii.hexlify(self.salt)) + ", "
-        output += "template: " + str(self.template) + ", "
-        if self.notes:
-            output += "URL: " + str(self.url) + ", "
+            output.append("fixed password: " + str(self.fixed_password) + ", ")
+        output.append("password length: " + str(self.length) + ", ")
+        output.append("extra character set: \"" + self.extra_characters +
+            "\", ")
+        output.append("iteration count: " + str(self.iterations) + ", ")
+        output.append("salt: " + self.salt.hex() + ", ")
+        output.append("template: " + str(self.template) + ", ")
+        if self.url:
+            output.append("URL: " + str(self.url) + ", ")
         if self.notes:
-            output += "notes: " + str(self.notes) + ", "
-        output += "modification date: " + self.get_modification_date() + ", "
-        output += "creation date: " + self.get_creation_date() + ", "
-        output += ")>"
-        return output
+            output.append("notes: " + str(self.notes) + ", ")
+        output.append("modification date: " + self.get_modification_date() +
+            ", ")
+        output.append("creation date: " + self.get_creation_date() + ", ")
+        output.append(")>")
+        return "".join(output)
+
+    @staticmethod
+    def is_negative_answer(answer):
+        """
+        Returns True if the answer to a yes/no question is negative.
+
+        :param answer: the answer entered by the user
+        :type answer: str
+        :return: True if the answer is negative
+        :rtype: bool
+        """
+        return answer.strip().lower() in NEGATIVE_ANSWERS
 
     def get_domain(self):
         """
@@ -81,8 +130,7 @@ class Setting(object):
             answer = input("Changing the domain names entails a change of the "
                 + "generated password. Are you sure you want to change the " +
                 "  domain name? [y/n] ")
-            if answer in ["n", "N", "no", "No", "NO", "not", "Not", "NOT",
-                "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+            if self.is_negative_answer(answer):
                 return
         print("Current domain name: " + self.get_domain())
         self.set_domain(input("New domain name: "))
@@ -132,8 +180,7 @@ class Setting(object):
             while len(self.get_username()) < 1:
                 answer = input("Are you sure you want to delete the username? "
                     + "[y/n] ")
-                if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                    "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+                if not self.is_negative_answer(answer):
                     self.set_username("")
                     break
                 else:
@@ -189,8 +236,7 @@ class Setting(object):
         :return: the default character set
         :rtype: str
         """
-        return DEFAULT_DIGITS + DEFAULT_LOWER_CASE_CHARACTERS + \
-            DEFAULT_UPPER_CASE_CHARACTERS + DEFAULT_EXTRA_CHARACTERS
+        return DEFAULT_CHARACTER_SET
 
     @staticmethod
     def get_lower_case_character_set():
@@ -229,14 +275,15 @@ class Setting(object):
         :return: the whole character set
         :rtype: str
         """
+        template = self.get_template()
         used_characters = ""
-        if "n" in self.get_template():
+        if "n" in template:
             used_characters += DEFAULT_DIGITS
-        if "a" in self.get_template():
+        if "a" in template:
             used_characters += DEFAULT_LOWER_CASE_CHARACTERS
-        if "A" in self.get_template():
+        if "A" in template:
             used_characters += DEFAULT_UPPER_CASE_CHARACTERS
-        if "o" in self.get_template():
+        if "o" in template:
             used_characters += self.get_extra_character_set()
         return used_characters
 
@@ -277,20 +324,34 @@ class Setting(object):
         and stored in binary format.
 
         :param salt: a salt
-        :type salt: bytes or str
+        :type salt: bytes, bytearray, or str
         """
-        if type(salt) == bytes:
-            self.salt = salt
-        elif type(salt) == str:
+        if isinstance(salt, (bytes, bytearray)):
+            self.salt = bytes(salt)
+        elif isinstance(salt, str):
             self.salt = salt.encode("utf-8")
         else:
             raise TypeError("The passed salt should be of type byte or string.")
+        self.salt_base64 = None
 
     def new_salt(self):
         """
         Creates a new salt for the setting.
         """
         self.salt = Crypter.create_salt()
+        self.salt_base64 = None
+
+    def get_salt_base64(self):
+        """
+        Returns the Base64 encoded salt. The encoding is cached until the salt
+        changes.
+
+        :return: the Base64 encoded salt
+        :rtype: str
+        """
+        if self.salt_base64 is None:
+            self.salt_base64 = b64encode(self.salt).decode("ascii")
+        return self.salt_base64
 
     def get_length(self):
         """
@@ -303,13 +364,14 @@ class Setting(object):
 
     def set_length(self, length):
         """
-        Sets the password length.
+        Sets the password length and recalculates the template with the
+        character classes of the current template.
         
-        :param iterations: a password length
-        :type iterations: int
+        :param length: a password length
+        :type length: int
         """
         self.length = length
-        self.set_complexity(self.get_complexity())
+        self.calculate_template()
 
     def get_iterations(self):
         """
@@ -329,6 +391,25 @@ class Setting(object):
         """
         self.iterations = iterations
 
+    @staticmethod
+    def parse_date(date):
+        """
+        Parses a date in the format YYYY-MM-DDTHH:MM:SS as it is stored in the
+        settings file. Other ISO 8601 forms like dates without a time or with a
+        UTC offset raise a ValueError.
+
+        :param date: the date
+        :type date: str
+        :return: the date
+        :rtype: datetime
+        """
+        parsed_date = datetime.fromisoformat(date)
+        if parsed_date.tzinfo is not None or \
+            parsed_date.isoformat(timespec = "seconds") != date:
+            raise ValueError("The date must have the format " +
+                "YYYY-MM-DDTHH:MM:SS.")
+        return parsed_date
+
     def get_c_date(self):
         """
         Returns the creation date as a datetime object.
@@ -345,7 +426,7 @@ class Setting(object):
         :return: the creation date
         :rtype: str
         """
-        return self.creation_date.strftime("%Y-%m-%dT%H:%M:%S")
+        return self.creation_date.isoformat(timespec = "seconds")
 
     def set_creation_date(self, creation_date):
         """
@@ -355,8 +436,7 @@ class Setting(object):
         :type creation_date: str
         """
         try:
-            self.creation_date = datetime.strptime(creation_date,
-                "%Y-%m-%dT%H:%M:%S")
+            self.creation_date = Setting.parse_date(creation_date)
         except ValueError:
             print("This creation date has a wrong format: " + creation_date)
         if self.modification_date < self.creation_date:
@@ -378,7 +458,7 @@ class Setting(object):
         :return: the modification date
         :rtype: str
         """
-        return self.modification_date.strftime("%Y-%m-%dT%H:%M:%S")
+        return self.modification_date.isoformat(timespec = "seconds")
 
     def set_modification_date(self, modification_date = None):
         """
@@ -387,10 +467,10 @@ class Setting(object):
         :param modification_date: a modification date
         :type modification_date: str
         """
-        if type(modification_date) == str:
+        if isinstance(modification_date, str):
             try:
-                self.modification_date = datetime.strptime(modification_date,
-                    "%Y-%m-%dT%H:%M:%S")
+                self.modification_date = Setting.parse_date(
+                    modification_date)
             except ValueError:
                 print("This modification date has a wrong format: " +
                     modification_date)
@@ -431,8 +511,7 @@ class Setting(object):
             while len(self.get_notes()) < 1:
                 answer = input("Are you sure you want to delete the notes? " +
                     "[y/n] ")
-                if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                    "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+                if not self.is_negative_answer(answer):
                     self.set_notes("")
                     break
                 else:
@@ -480,8 +559,7 @@ class Setting(object):
                 + "URL: "))
             while len(self.get_url()) < 1:
                 answer = input("Are you sure you want to delete the URL? [y/n] ")
-                if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                    "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+                if not self.is_negative_answer(answer):
                     self.set_url("")
                     break
                 else:
@@ -517,36 +595,28 @@ class Setting(object):
             from the current template if set to None.
         :type use_lower_case: bool
         """
+        template = self.get_template()
         if use_lower_case is None:
-            use_lower_case = "a" in self.get_template()
+            use_lower_case = "a" in template
         if use_upper_case is None:
-            use_upper_case = "A" in self.get_template()
+            use_upper_case = "A" in template
         if use_digits is None:
-            use_digits = "n" in self.get_template()
+            use_digits = "n" in template
         if use_extra is None:
-            use_extra = "o" in self.get_template()
-        len = []
-        inserted_lower = False
-        inserted_upper = False
-        inserted_digit = False
-        inserted_extra = False
-        for i in range(self.get_length()):
-            if use_lower_case and not inserted_lower:
-                len.append("a")
-                inserted_lower = True
-            elif use_upper_case and not inserted_upper:
-                len.append("A")
-                inserted_upper = True
-            elif use_digits and not inserted_digit:
-                len.append("n")
-                inserted_digit = True
-            elif use_extra and not inserted_extra:
-                len.append("o")
-                inserted_extra = True
-            else:
-                len.append("x")
-        shuffle(len)
-        self.template = "".join(len)
+            use_extra = "o" in template
+        markers = []
+        if use_lower_case:
+            markers.append("a")
+        if use_upper_case:
+            markers.append("A")
+        if use_digits:
+            markers.append("n")
+        if use_extra:
+            markers.append("o")
+        length = self.get_length()
+        template = (markers + ["x"] * length)[:length]
+        shuffle(template)
+        self.template = "".join(template)
 
     def get_template(self):
         """
@@ -573,24 +643,10 @@ class Setting(object):
         :param complexity: a digit from 1 to 8
         :type complexity: int
         """
-        if not 1 <= complexity <= 8:
-            ValueError("The complexity must be an integer in the range 1 to 8.")
-        if complexity == 1:
-            self.calculate_template(False, False, True, False)
-        elif complexity == 2:
-            self.calculate_template(True, False, False, False)
-        elif complexity == 3:
-            self.calculate_template(False, True, False, False)
-        elif complexity == 4:
-            self.calculate_template(True, False, True, False)
-        elif complexity == 5:
-            self.calculate_template(False, True, True, False)
-        elif complexity == 6:
-            self.calculate_template(True, True, True, False)
-        elif complexity == 7:
-            self.calculate_template(True, True, True, True)
-        elif complexity == 8:
-            self.calculate_template(False, False, False, True)
+        if complexity not in COMPLEXITY_FLAGS:
+            raise ValueError("The complexity must be an integer in the range 1 "
+                + "to 8.")
+        self.calculate_template(*COMPLEXITY_FLAGS[complexity])
 
     def get_complexity(self):
         """
@@ -600,32 +656,24 @@ class Setting(object):
         :return: a digit from 1 to 8 or -1
         :rtype: int
         """
-        if "n" in self.get_template() and "a" not in self.get_template() and \
-            "A" not in self.get_template() and "o" not in self.get_template():
-            return 1
-        elif "n" not in self.get_template() and "a" in self.get_template() and \
-            "A" not in self.get_template() and "o" not in self.get_template():
-            return 2
-        elif "n" not in self.get_template() and "a" not in self.get_template() \
-            and "A" in self.get_template() and "o" not in self.get_template():
-            return 3
-        elif "n" in self.get_template() and "a" in self.get_template() and \
-            "A" not in self.get_template() and "o" not in self.get_template():
-            return 4
-        elif "n" not in self.get_template() and "a" in self.get_template() and \
-            "A" in self.get_template() and "o" not in self.get_template():
-            return 5
-        elif "n" in self.get_template() and "a" in self.get_template() and \
-            "A" in self.get_template() and "o" not in self.get_template():
-            return 6
-        elif "n" in self.get_template() and "a" in self.get_template() and \
-            "A" in self.get_template() and "o" in self.get_template():
-            return 7
-        elif "n" not in self.get_template() and "a" not in self.get_template() \
-            and "A" not in self.get_template() and "o" in self.get_template():
-            return 8
-        else:
-            return -1
+        template = self.get_template()
+        markers = ("n" in template) | ("a" in template) << 1 | \
+            ("A" in template) << 2 | ("o" in template) << 3
+        return COMPLEXITY_BY_MARKERS.get(markers, -1)
+
+    @staticmethod
+    def get_complexity_description(complexity):
+        """
+        Returns the description of the complexity. An unknown complexity is
+        described as extra characters.
+
+        :param complexity: a digit from 1 to 8 or -1
+        :type complexity: int
+        :return: the description
+        :rtype: str
+        """
+        return COMPLEXITY_DESCRIPTIONS.get(complexity,
+            COMPLEXITY_DESCRIPTIONS[8])
 
     def to_dict(self):
         """
@@ -634,28 +682,28 @@ class Setting(object):
         :return: the settings dictionary
         :rtype: dict
         """
-        domain_object = {"domain name": self.get_domain()}
-        if self.get_username():
-            domain_object["username"] = self.get_username()
-        if self.get_fixed_password():
-            domain_object["fixed_password"] = self.get_fixed_password()
-        domain_object["length"] = self.get_length()
-        domain_object["extra_character_set"] = self.get_extra_character_set()
-        domain_object["iterations"] = self.get_iterations()
-        domain_object["salt"] = str(b64encode(self.get_salt()),
-            encoding = "utf-8")
-        domain_object["template"] = self.get_template()
-        if self.get_url():
-            domain_object["URL"] = self.get_url()
+        domain_object = {"domain name": self.domain}
+        if self.username:
+            domain_object["username"] = self.username
+        if self.fixed_password:
+            domain_object["fixed_password"] = self.fixed_password
+        domain_object["length"] = self.length
+        domain_object["extra_character_set"] = self.extra_characters
+        domain_object["iterations"] = self.iterations
+        domain_object["salt"] = self.get_salt_base64()
+        domain_object["template"] = self.template
+        if self.url:
+            domain_object["URL"] = self.url
         if self.notes:
-            domain_object["notes"] = self.get_notes()
+            domain_object["notes"] = self.notes
         domain_object["creation_date"] = self.get_creation_date()
         domain_object["modification_date"] = self.get_modification_date()
         return domain_object
 
     def load_from_dict(self, loaded_setting):
         """
-        Loads the settings from a dictionary.
+        Loads the settings from a dictionary. The template is only
+        recalculated for the loaded length if no template is loaded.
 
         :param loaded_setting: a settings dictionary
         :type loaded_setting: dict
@@ -665,7 +713,10 @@ class Setting(object):
         if "fixed_password" in loaded_setting:
             self.set_fixed_password(loaded_setting["fixed_password"])
         if "length" in loaded_setting:
-            self.set_length(loaded_setting["length"])
+            if "template" in loaded_setting:
+                self.length = loaded_setting["length"]
+            else:
+                self.set_length(loaded_setting["length"])
         if "extra_character_set" in loaded_setting:
             self.set_extra_character_set(loaded_setting["extra_character_set"])
         if "iterations" in loaded_setting:
@@ -683,38 +734,41 @@ class Setting(object):
         if "modification_date" in loaded_setting:
             self.set_modification_date(loaded_setting["modification_date"])
 
-    def set_generated_password(self):
+    @staticmethod
+    def input_length(prompt):
         """
-        Displays input prompts for the settings pertaining to a generated
-        password.
+        Prompts for a password length until a positive integer is entered.
+
+        :param prompt: the prompt for the first input
+        :type prompt: str
+        :return: the password length
+        :rtype: int
         """
-        length_str = input("Password length: ")
+        length_str = input(prompt)
         while True:
             try:
-                length_int = int(length_str)
-                if length_int <= 0:
-                    print("The password length must be greater than 0.")
-                    length_str = input("New password length: ")
-                else:
-                    self.set_length(length_int)
-                    break
+                length = int(length_str)
+                if length > 0:
+                    return length
+                print("The password length must be greater than 0.")
             except ValueError:
                 print("The password length must be an integer.")
-                length_str = input("New password length: ")
-        option = input("Choose a password complexity:\n1\tdigits\n2\tlower " +
-            "case characters" + "\n3\tupper case characters\n4\tdigits and " +
-            "lower case characters" + "\n5\tdigits and upper case characters" +
-            "\n6\tdigits, lower case characters, and upper case characters\n7" +
-            "\tdigits, lower case characters, upper case characters, and extra "
-            + "characters\n8\textra characters\n[1/2/3/4/5/6/7/8] ")
-        while option not in ["1", "2", "3", "4", "5", "6", "7", "8"]:
+            length_str = input("New password length: ")
+
+    def set_generated_password(self):
+        """
+        Displays input prompts for the settings pertaining to a generated
+        password.
+        """
+        self.set_length(Setting.input_length("Password length: "))
+        option = input(COMPLEXITY_PROMPT)
+        while option not in OPTIONS_1_TO_8:
             option = input('Enter "1", "2", "3", "4", "5", "6", "7", or "8": ')
         self.set_complexity(int(option))
-        if option in ["7", "8"]:
+        if option in ("7", "8"):
             print("Extra character set: " + self.get_extra_character_set())
             answer = input("Change extra character set? [y/n] ")
-            if answer not in ["n", "N", "no", "No", "NO", "not", "Not", "NOT",
-                "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+            if not self.is_negative_answer(answer):
                 self.set_extra_character_set(input("New extra character set: "))
         print("Password generation was successful.")
 
@@ -724,21 +778,20 @@ class Setting(object):
         domain.
         """
         answer = input("Set a username? [y/n] ")
-        if answer not in ["n", "N", "no", "No", "NO", "not", "Not", "NOT",
-            "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+        if not self.is_negative_answer(answer):
             self.set_username(input("Username: "))
             while len(self.get_username()) < 1:
                 print("The username must consist of at least one character.")
                 self.set_username(input("Username: "))
         answer = input("Generate a password (alternatively a fixed password " +
             "can be stored)? [y/n] ")
-        if answer in ["n", "N", "no", "No", "NO", "not", "Not", "NOT", "nay",
-            "Nay", "NAY", "nein", "Nein", "NEIN"]:
-            self.set_fixed_password(getpass.getpass("Fixed password: "))
-            while len(self.get_fixed_password()) < 1:
+        if self.is_negative_answer(answer):
+            fixed_password = getpass.getpass("Fixed password: ")
+            while len(fixed_password) < 1:
                 print("The fixed password must consist of at least one " +
                     "character.")
-                self.set_fixed_password(getpass.getpass("Fixed password: "))
+                fixed_password = getpass.getpass("Fixed password: ")
+            self.set_fixed_password(fixed_password)
         else:
             self.set_generated_password()
 
@@ -751,25 +804,10 @@ class Setting(object):
             print("Username: " + self.get_username())
         if not self.has_fixed_password():
             print("Password length: " + str(self.get_length()))
-            if self.get_complexity() == 1:
-                print("Password complexity: digits")
-            elif self.get_complexity() == 2:
-                print("Password complexity: lower case characters")
-            elif self.get_complexity() == 3:
-                print("Password complexity: upper case characters")
-            elif self.get_complexity() == 4:
-                print("Password complexity: digits and lower case characters")
-            elif self.get_complexity() == 5:
-                print("Password complexity: digits and upper case characters")
-            elif self.get_complexity() == 6:
-                print("Password complexity: digits, lower case characters, and "
-                    + "upper case characters")
-            elif self.get_complexity() == 7:
-                print("Password complexity: digits, lower case characters, " +
-                    "upper case characters, and extra characters")
-                print("Extra character set: " + self.get_extra_character_set())
-            else:
-                print("Password complexity: extra characters")
+            complexity = self.get_complexity()
+            print("Password complexity: " +
+                Setting.get_complexity_description(complexity))
+            if complexity not in (1, 2, 3, 4, 5, 6):
                 print("Extra character set: " + self.get_extra_character_set())
         if self.get_url() != "":
             print("URL: " + self.get_url())
@@ -784,112 +822,67 @@ class Setting(object):
         Menu to change and delete settings. Is called if the password was
         generated.
         """
+        handlers = {
+            "1": lambda: self.change_domain(generated_password = True),
+            "2": self.change_delete_username,
+            "6": self.change_delete_url,
+            "7": self.change_delete_notes}
         while True:
-            print("Choose one of the following options:\n1\tchange domain name")
-            if self.has_username():
-                print("2\tchange or delete username")
-            else:
-                print("2\tset username")
-            print("3\tset fixed password (the generated password will be " +
-                "deleted)")
-            print("4\tchange password length")
-            print("5\tchange password complexity")
-            if self.get_url():
-                print("6\tchange or delete URL")
-            else:
-                print("6\tset URL")
-            if self.get_notes():
-                print("7\tchange or delete notes")
-            else:
-                print("7\tset notes")
-            option = input("8\treturn to previous menu\n[1/2/3/4/5/6/7/8] ")
-            while option not in ["1", "2", "3", "4", "5", "6", "7", "8"]:
-                option = input('Enter "1", "2", "3", "4", "5", "6", "7", or ' +
+            option = input("\n".join([
+                "Choose one of the following options:",
+                "1\tchange domain name",
+                "2\tchange or delete username" if self.has_username() else
+                    "2\tset username",
+                "3\tset fixed password (the generated password will be "
+                    "deleted)",
+                "4\tchange password length",
+                "5\tchange password complexity",
+                "6\tchange or delete URL" if self.get_url() else "6\tset URL",
+                "7\tchange or delete notes" if self.get_notes() else
+                    "7\tset notes",
+                "8\treturn to previous menu",
+                "[1/2/3/4/5/6/7/8] "]))
+            while option not in OPTIONS_1_TO_8:
+                option = input('Enter "1", "2", "3", "4", "5", "6", "7", or '
                     '"8": ')
-            if option == "1":
-                self.change_domain(generated_password = True)
-            elif option == "2":
-                self.change_delete_username()
+            if option in handlers:
+                handlers[option]()
             elif option == "3":
                 answer = input("Are you sure you want to delete the generated "
-                    + "password [y/n] ")
-                if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                    "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
-                    self.set_fixed_password(getpass.getpass("Fixed password: "))
-                    while len(self.get_fixed_password()) < 1:
+                    "password [y/n] ")
+                if not self.is_negative_answer(answer):
+                    fixed_password = getpass.getpass("Fixed password: ")
+                    while len(fixed_password) < 1:
                         print("The fixed password must consist of at least one "
-                            + "character.")
-                        self.set_fixed_password(getpass.getpass("Fixed " +
-                            "password: "))
-                    input("The generated password was deleted and the fixed " +
+                            "character.")
+                        fixed_password = getpass.getpass("Fixed password: ")
+                    self.set_fixed_password(fixed_password)
+                    input("The generated password was deleted and the fixed "
                         "password was set. Press any key to continue.")
                     self.set_settings_menu_fixed_password()
                     break
             elif option == "4":
                 print("Current password length: " + str(self.get_length()))
-                length_str = input("New password length: ")
-                while True:
-                    try:
-                        length = int(length_str)
-                        if length <= 0:
-                            print("The password length must be greater than 0.")
-                            length_str = input("New password length: ")
-                        else:
-                            self.set_length(length)
-                            break
-                    except ValueError:
-                        print("The password length must be an integer.")
-                        length_str = input("New password length: ")
-                input("The password length was changed. Press any key to " +
+                self.set_length(Setting.input_length("New password length: "))
+                input("The password length was changed. Press any key to "
                     "continue.")
             elif option == "5":
-                if self.get_complexity() == 1:
-                    print("Current password complexity: digits")
-                elif self.get_complexity() == 2:
-                    print("Current password complexity: lower case characters")
-                elif self.get_complexity() == 3:
-                    print("Current password complexity: upper case characters")
-                elif self.get_complexity() == 4:
-                    print("Current password complexity: digits and lower case "
-                        + "characters")
-                elif self.get_complexity() == 5:
-                    print("Current password complexity: digits and upper case "
-                        + "characters")
-                elif self.get_complexity() == 6:
-                    print("Current password complexity: digits, lower case "
-                        + "characters, and upper case characters")
-                elif self.get_complexity() == 7:
-                    print("Current password complexity: digits, lower case " +
-                        "characters, upper case characters, and extra " +
-                        "characters")
-                else:
-                    print("Current password complexity: extra characters")
-                option_complexity = input("Choose a new password complexity:" +
-                    "\n1\tdigits\n2\tlower case characters\n3\tupper case " +
-                    "characters\n4\tdigits and lower case characters\n5\t" +
-                    "digits and upper case characters\n6\tdigits, lower case " +
-                    "characters, and upper case characters\n7\tdigits, lower " +
-                    "case characters, upper case characters, and extra " +
-                    "characters\n8\textra characters\n[1/2/3/4/5/6/7/8] ")
-                while option_complexity not in ["1", "2", "3", "4", "5", "6",
-                    "7", "8"]:
+                print("Current password complexity: " +
+                    Setting.get_complexity_description(self.get_complexity()))
+                option_complexity = input(COMPLEXITY_NEW_PROMPT)
+                while option_complexity not in OPTIONS_1_TO_8:
                     option_complexity = input('Enter "1", "2", "3", "4", "5", '
-                        + '"6", "7", or "8": ')
+                        '"6", "7", or "8": ')
                 self.set_complexity(int(option_complexity))
-                if option_complexity in ["7", "8"]:
+                if option_complexity in ("7", "8"):
                     print("Current extra character set: " +
                         self.get_extra_character_set())
                     answer = input("Change extra character set? [y/n] ")
-                    if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                        "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
-                        self.set_extra_character_set(input("New extra " +
+                    if not self.is_negative_answer(answer):
+                        self.set_extra_character_set(input("New extra "
                             "character set: "))
-                input("The password complexity was changed. Press any key to " +
+                input("The password complexity was changed. Press any key to "
                     "continue.")
-            elif option == "6":
-                self.change_delete_url()
-            elif option == "7":
-                self.change_delete_notes()
             else:
                 break
 
@@ -898,53 +891,47 @@ class Setting(object):
         Menu to change and delete settings. Is called if a fixed password was
         set.
         """
+        handlers = {
+            "1": lambda: self.change_domain(generated_password = False),
+            "2": self.change_delete_username,
+            "5": self.change_delete_url,
+            "6": self.change_delete_notes}
         while True:
-            print("Choose one of the following options:\n1\tchange domain name")
-            if self.has_username():
-                print("2\tchange or delete username")
-            else:
-                print("2\tset username")
-            print("3\tchange fixed password")
-            print("4\tdelete fixed password (a password will be generated)")
-            if self.get_url():
-                print("5\tchange or delete URL")
-            else:
-                print("5\tset URL")
-            if self.get_notes():
-                print("6\tchange or delete notes")
-            else:
-                print("6\tset notes")
-            option = input("7\treturn to previous menu\n[1/2/3/4/5/6/7] ")
-            while option not in ["1", "2", "3", "4", "5", "6", "7"]:
+            option = input("\n".join([
+                "Choose one of the following options:",
+                "1\tchange domain name",
+                "2\tchange or delete username" if self.has_username() else
+                    "2\tset username",
+                "3\tchange fixed password",
+                "4\tdelete fixed password (a password will be generated)",
+                "5\tchange or delete URL" if self.get_url() else "5\tset URL",
+                "6\tchange or delete notes" if self.get_notes() else
+                    "6\tset notes",
+                "7\treturn to previous menu",
+                "[1/2/3/4/5/6/7] "]))
+            while option not in OPTIONS_1_TO_7:
                 option = input('Enter "1", "2", "3", "4", "5", "6", or "7": ')
-            if option == "1":
-                self.change_domain(generated_password = False)
-            elif option == "2":
-                self.change_delete_username()
+            if option in handlers:
+                handlers[option]()
             elif option == "3":
                 print("Current fixed password: " + self.get_fixed_password())
-                self.set_fixed_password(getpass.getpass("New fixed password: "))
-                while len(self.get_fixed_password()) < 1:
+                fixed_password = getpass.getpass("New fixed password: ")
+                while len(fixed_password) < 1:
                     print("The new fixed password must consist of at least one "
-                        + "character.")
-                    self.set_fixed_password(getpass.getpass("New fixed " +
-                        "password: "))
-                input("The fixed password was changed. Press any key to " +
+                        "character.")
+                    fixed_password = getpass.getpass("New fixed password: ")
+                self.set_fixed_password(fixed_password)
+                input("The fixed password was changed. Press any key to "
                     "continue.")
             elif option == "4":
-                answer = input("Are you sure you want to delete the fixed " +
+                answer = input("Are you sure you want to delete the fixed "
                     "password? [y/n] ")
-                if answer not in ["n", "N", "no", "No", "NO", "not", "Not",
-                    "NOT", "nay", "Nay", "NAY", "nein", "Nein", "NEIN"]:
+                if not self.is_negative_answer(answer):
                     self.set_fixed_password("")
                     self.set_generated_password()
-                    input("The fixed password was deleted and a password was " +
+                    input("The fixed password was deleted and a password was "
                         "generated. Press any key to continue.")
                     self.set_settings_menu_generated_password()
                     break
-            elif option == "5":
-                self.change_delete_url()
-            elif option == "6":
-                self.change_delete_notes()
             else:
                 break
@@ -6,7 +6,6 @@ SettingsManager handles the settings for all domains.
 
 import json
 import struct
-from datetime import datetime
 from setting import Setting
 from crypter import Crypter
 from packer import Packer
@@ -17,7 +16,8 @@ from key_generation_key_manager import KeyGenerationKeyManager
 class SettingsManager(object):
     def __init__(self, preference_manager):
         self.preference_manager = preference_manager
-        self.settings = []
+        self.settings = {}
+        self.version = 0
 
     @staticmethod
     def get_settings_crypter(key_generation_key_manager):
@@ -46,34 +46,32 @@ class SettingsManager(object):
             return
         settings_crypter = SettingsManager.get_settings_crypter(
             key_generation_key_manager)
-        decrypted_settings = settings_crypter.decrypt(encrypted_settings)
+        try:
+            decrypted_settings = settings_crypter.decrypt(encrypted_settings)
+        except ValueError:
+            raise PermissionError("Wrong master password: The settings could "
+                + "not be decrypted.")
         try:
             decompressed_settings = Packer.decompress(decrypted_settings[4:])
         except ValueError:
             raise PermissionError("Wrong master password: The settings could "
                 + "not be decompressed.")
-        settings_len = struct.unpack("!I", decrypted_settings[0:4])[0]
-        saved_settings = json.loads(str(decompressed_settings,
-            encoding="utf-8"))
-        if len(saved_settings) < settings_len:
-            raise ValueError("The decrypted settings are too short to be " +
-                "decompressed.")
-        for domain_name in saved_settings.keys():
-            data_set = saved_settings[domain_name]
-            found = False
-            i = 0
-            while i < len(self.settings):
-                setting = self.settings[i]
-                if setting.get_domain() == domain_name:
-                    found = True
-                    if datetime.strptime(data_set["mDate"],
-                        "%Y-%m-%dT%H:%M:%S") > setting.get_m_date():
-                        setting.load_from_dict(data_set)
-                i += 1
-            if not found:
+        saved_settings = json.loads(decompressed_settings)
+        for domain_name, data_set in saved_settings.items():
+            setting = self.settings.get(domain_name)
+            if setting is not None:
+                try:
+                    modification_date = Setting.parse_date(
+                        data_set.get("modification_date"))
+                except (TypeError, ValueError):
+                    continue
+                if modification_date > setting.get_m_date():
+                    setting.load_from_dict(data_set)
+            else:
                 new_setting = Setting(domain_name)
                 new_setting.load_from_dict(data_set)
-                self.settings.append(new_setting)
+                self.settings[domain_name] = new_setting
+        self.version += 1
 
     def store_settings(self, key_generation_key_manager):
         """
@@ -86,10 +84,12 @@ class SettingsManager(object):
         key_generation_key_manager.new_initialization_vector2()
         settings_crypter = SettingsManager.get_settings_crypter(
             key_generation_key_manager)
-        self.preference_manager.store_settings_data(settings_crypter.encrypt(
-            struct.pack('!I', len(self.get_settings_as_dict())) +
-            Packer.compress(json.dumps(self.get_settings_as_dict()))))
-        key_generation_key_manager.store_key_generation_key_block_salt()
+        settings_dict = self.get_settings_as_dict()
+        settings_data = settings_crypter.encrypt(
+            struct.pack('!I', len(settings_dict)) +
+            Packer.compress(json.dumps(settings_dict)))
+        key_generation_key_manager.store_key_generation_key_block_salt(
+            settings_data)
 
     def get_setting(self, domain):
         """
@@ -101,25 +101,30 @@ class SettingsManager(object):
         :return: the settings
         :rtype: Setting
         """
-        for setting in self.settings:
-            if setting.get_domain() == domain:
-                return setting
+        if domain in self.settings:
+            return self.settings[domain]
         setting = Setting(domain)
-        self.settings.append(setting)
+        self.settings[domain] = setting
+        self.version += 1
         return setting
 
-    def set_setting(self, setting):
+    def set_setting(self, setting, previous_domain = None):
         """
         Stores the settings for a domain in the RAM. Call store_settings to
-        store them on the hard drive.
+        store them on the hard drive. If the domain of the settings was
+        renamed they are no longer stored under the previous domain name.
 
         :param setting: the settings
         :type setting: Setting
+        :param previous_domain: the domain name before the settings were
+            changed
+        :type previous_domain: str
         """
-        for i, existing_setting in enumerate(self.settings):
-            if existing_setting.get_domain() == setting.get_domain():
-                self.settings.pop(i)
-        self.settings.append(setting)
+        if previous_domain is not None and \
+            self.settings.get(previous_domain) is setting:
+            del self.settings[previous_domain]
+        self.settings[setting.get_domain()] = setting
+        self.version += 1
 
     def delete_setting(self, setting):
         """
@@ -128,13 +133,18 @@ class SettingsManager(object):
         :param setting: the settings
         :type setting: Setting
         """
-        i = 0
-        while i < len(self.settings):
-            existing_setting = self.settings[i]
-            if existing_setting.get_domain() == setting.get_domain():
-                self.settings.pop(i)
-            else:
-                i += 1
+        self.settings.pop(setting.get_domain(), None)
+        self.version += 1
+
+    def get_version(self):
+        """
+        Returns the version of the settings in the RAM. It is increased
+        whenever settings are loaded, added, changed, or deleted.
+
+        :return: the version
+        :rtype: int
+        """
+        return self.version
 
     def get_domain_list(self):
         """
@@ -143,7 +153,7 @@ class SettingsManager(object):
         :return: the list of domain names
         :rtype: [str]
         """
-        return [setting.get_domain() for setting in self.settings]
+        return list(self.settings)
 
     def get_settings_as_dict(self):
         """
@@ -152,7 +162,5 @@ class SettingsManager(object):
         :return: the dictionary with the list of settings
         :rtype: dict
         """
-        settings_dict = {}
-        for setting in self.settings:
-            settings_dict[setting.get_domain()] = setting.to_dict()
-        return settings_dict
+        return {domain: setting.to_dict() for domain, setting in
+            self.settings.items()}